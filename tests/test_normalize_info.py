@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("redbot")
+
+from user_handle.user_handle import _normalize_info  # noqa: E402
+
+
+def test_canonical_entry_is_returned_as_is():
+    info = {"sync_role_id": 1, "custom_roles": [{"role_id": 2, "name": "Alice"}]}
+    result = _normalize_info(info)
+    assert result is info
+    assert result == {"sync_role_id": 1, "custom_roles": [{"role_id": 2, "name": "Alice"}]}
+
+
+def test_entry_without_legacy_keys_fills_defaults():
+    assert _normalize_info({}) == {"sync_role_id": None, "custom_roles": []}
+    assert _normalize_info({"sync_role_id": 1}) == {"sync_role_id": 1, "custom_roles": []}
+
+
+def test_legacy_custom_role_id_is_migrated_without_touching_input():
+    info = {"sync_role_id": 1, "custom_roles": [], "custom_role_id": 5, "custom_name": "Bob"}
+    result = _normalize_info(info)
+    assert result == {"sync_role_id": 1, "custom_roles": [{"role_id": 5, "name": "Bob"}]}
+    assert info["custom_roles"] == []
+    assert result["custom_roles"] is not info["custom_roles"]
+
+
+def test_legacy_role_id_becomes_sync_role():
+    assert _normalize_info({"role_id": 7}) == {"sync_role_id": 7, "custom_roles": []}
+
+
+def test_legacy_role_id_with_name_becomes_custom_handle():
+    assert _normalize_info({"role_id": 7, "custom_name": "Carol"}) == {
+        "sync_role_id": None,
+        "custom_roles": [{"role_id": 7, "name": "Carol"}],
+    }
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import weakref
 from typing import Optional
 
 import discord
@@ -17,12 +18,22 @@ try:
 except ImportError:
     Route = None
 
-__version__ = "2.14"
+__version__ = "2.15"
 log = logging.getLogger("red.cog.user_handle")
+_FULL_SWEEP_EVERY = 360  # background passes between sweeps of every guild (360 x 1 min = 6 h)
+_LOG_FLUSH_DELAY = 5.0  # seconds log messages are buffered per guild before one combined send
+_MESSAGE_MAX_CHARS = 2000  # Discord's per-message limit
+_CANONICAL_KEYS = frozenset({"sync_role_id", "custom_roles"})
 
 
 def _normalize_info(info: dict) -> dict:
     """Normalize stored info to sync_role_id and custom_roles (list of {role_id, name}). Handles old format."""
+    # Canonical entries (everything written since the migration) are returned as-is; callers never mutate them
+    if info.keys() == _CANONICAL_KEYS and isinstance(info["custom_roles"], list):
+        return info
+    if "custom_role_id" not in info and "role_id" not in info:
+        # No legacy keys: nothing to migrate, so no list copy
+        return {"sync_role_id": info.get("sync_role_id"), "custom_roles": info.get("custom_roles") or []}
     custom_roles = list(info.get("custom_roles") or [])
     # Migrate from single custom_role_id + custom_name
     old_id, old_name = info.get("custom_role_id"), info.get("custom_name")
@@ -38,43 +49,83 @@ def _normalize_info(info: dict) -> dict:
     return {"sync_role_id": sync_role_id, "custom_roles": custom_roles}
 
 
+def _name_key(name: Optional[str]) -> str:
+    """Case-insensitive comparison key for handle and blacklist names (casefold handles non-ASCII scripts)."""
+    return (name or "").strip().casefold()
+
+
 def _display_name(member: discord.Member) -> str:
     """Server display name: nickname if set, else username."""
     return member.display_name or member.name
 
 
-async def _fetch_guild_members_via_rest(bot, guild: discord.Guild):
-    """Fetch all guild members via REST API. Use when cache is empty (e.g. Red with strict member cache)."""
-    if Route is None:
-        return None
-    state = getattr(bot, "_connection", None) or getattr(bot, "connection", None)
-    if not state or not hasattr(bot, "http"):
-        return None
-    members = []
-    after = 0
-    try:
-        while True:
-            # Discord API: GET /guilds/{id}/members?limit=1000&after={after}
-            route = Route("GET", "/guilds/{guild_id}/members", guild_id=guild.id)
-            params = {"limit": 1000, "after": after}
-            data = await bot.http.request(route, params=params)
-            if not data:
-                break
-            for mdata in data:
-                try:
-                    member = discord.Member(data=mdata, guild=guild, state=state)
-                    if not member.bot:
-                        members.append(member)
-                except Exception:
-                    continue
-            if len(data) < 1000:
-                break
-            after = int(data[-1]["user"]["id"])
-            await asyncio.sleep(0.5)
-    except (discord.Forbidden, discord.HTTPException, AttributeError, KeyError) as e:
-        log.warning("UserHandle: REST fetch_members failed for guild %s: %s", guild.id, e)
-        return None
-    return members
+def _has_role(member: discord.Member, role_id: int) -> bool:
+    """Presence check on the member's sorted role-id list (bisect), skipping the Role lookup get_role does."""
+    roles = getattr(member, "_roles", None)
+    if roles is None or not hasattr(roles, "has"):
+        return member.get_role(role_id) is not None  # private attr changed in a future discord.py
+    return roles.has(role_id)
+
+
+def _member_role_ids(member: discord.Member) -> set[int]:
+    """Ids of the member's roles, without @everyone."""
+    roles = getattr(member, "_roles", None)
+    if roles is None:
+        return {r.id for r in member.roles if not r.is_default()}
+    return set(roles)
+
+
+async def _bounded(sem: asyncio.Semaphore, coro):
+    """Await coro while holding sem; shared by every caller that caps how many REST-heavy coroutines run at once."""
+    async with sem:
+        return await coro
+
+
+def _release_name(names: set[str], guild: discord.Guild, name: str, role_id: Optional[int] = None) -> None:
+    """Drop name from a role-name set unless a role other than role_id still uses it (names are not unique)."""
+    if not any(r.name == name for r in guild.roles if r.id != role_id):
+        names.discard(name)
+
+
+def _format_details(header: str, details: list[tuple[str, str, str]], max_lines: int = 25) -> str:
+    """Header plus one bullet per (display_name, username, text) entry, capped at max_lines."""
+    body = "\n".join(f"• **{d}** (username: `{u}`): {c}." for d, u, c in details[:max_lines])
+    tail = f"\n… and {len(details) - max_lines} more." if len(details) > max_lines else ""
+    return f"{header}\n{body}{tail}"
+
+
+def _log_header(guild: discord.Guild) -> str:
+    """First line of every admin log send."""
+    return f"**UserHandle** — **Server:** {guild.name} (`{guild.id}`)"
+
+
+def _pack_log(messages: list[str], limit: int) -> list[str]:
+    """Pack log messages into as few chunks of at most `limit` chars as fit, splitting any over-long message."""
+    pieces: list[str] = []
+    for message in messages:
+        while len(message) > limit:
+            cut = message.rfind("\n", 0, limit)
+            if cut <= 0:
+                cut = limit
+            pieces.append(message[:cut])
+            message = message[cut:].lstrip("\n")
+        pieces.append(message)
+    chunks: list[str] = []
+    chunk = ""
+    for piece in pieces:
+        if chunk and len(chunk) + len(piece) + 5 > limit:
+            chunks.append(chunk)
+            chunk = ""
+        chunk = f"{chunk}\n---\n{piece}" if chunk else piece
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+async def _gather_bounded(coros, limit: int = 8) -> list:
+    """Run coroutines concurrently, at most `limit` at a time. Exceptions are returned in place of results."""
+    sem = asyncio.Semaphore(limit)
+    return await asyncio.gather(*(_bounded(sem, c) for c in coros), return_exceptions=True)
 
 
 class UserHandle(commands.Cog):
@@ -92,11 +143,125 @@ class UserHandle(commands.Cog):
         )
         self._sync_lock = asyncio.Lock()
         self._last_sync_error: Optional[str] = None  # for reporting when sync creates 0 roles
+        self._cache: dict[int, dict[str, dict]] = {}  # guild id -> user id str -> normalized role_assignments entry
+        self._load_futures: dict[int, asyncio.Future] = {}  # guild id -> in-flight first load shared by callers
+        self._blacklist_cache: dict[int, frozenset[str]] = {}  # guild id -> lowered role_blacklist names
+        self._name_cache: dict[int, set[str]] = {}  # guild id -> role names; kept current by the role listeners
+        self._handle_owners: dict[int, dict[str, set[str]]] = {}  # guild id -> lowered custom handle -> user id strs
+        self._dirty_guilds: set[int] = set()  # guilds with name/role changes since their last background pass
+        self._chunk_futures: dict[int, asyncio.Future] = {}  # guild id -> in-flight guild.chunk() shared by callers
+        self._pending_dms: set[asyncio.Task] = set()  # log sends in flight; strong refs so they aren't GC'd mid-send
+        self._log_buffers: dict[int, list[str]] = {}  # guild id -> log messages waiting for the next flush
+        self._join_buffer: dict[int, list[discord.Member]] = {}  # guild id -> members joined since the last flush
+        self._join_flush_tasks: dict[int, asyncio.Task] = {}  # guild id -> scheduled _flush_joins
+        self._name_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()  # (guild id, name key) -> Lock
+        self._inflight_ensure: dict[tuple, asyncio.Task] = {}  # ("sync"|"custom", guild id, member id[, name]) -> running ensure
+
+    async def _load_guild(self, guild: discord.Guild) -> dict[str, dict]:
+        """Read this guild's role_assignments from Config once and cache the normalized entries."""
+        data = await self.config.guild(guild).role_assignments()
+        entries = {user_id_str: _normalize_info(info or {}) for user_id_str, info in (data or {}).items()}
+        self._set_cache(guild.id, entries)
+        return entries
+
+    def _set_cache(self, guild_id: int, entries: dict[str, dict]) -> None:
+        """Replace a guild's cached entries and rebuild its handle-name index."""
+        self._cache[guild_id] = entries
+        owners: dict[str, set[str]] = {}
+        for user_id_str, info in entries.items():
+            for c in info.get("custom_roles") or []:
+                owners.setdefault(_name_key(c.get("name")), set()).add(user_id_str)
+        self._handle_owners[guild_id] = owners
+
+    def _lock_for(self, guild_id: int, name: str) -> asyncio.Lock:
+        """Lock serializing claims on one handle name. Entries disappear once no caller holds the lock."""
+        key = (guild_id, _name_key(name))
+        lock = self._name_locks.get(key)
+        if lock is None:
+            lock = self._name_locks[key] = asyncio.Lock()
+        return lock
+
+    def _names_for(self, guild: discord.Guild) -> set[str]:
+        """Live set of the guild's role names, built on first use. Callers may add/discard names they create or rename."""
+        names = self._name_cache.get(guild.id)
+        if names is None:
+            names = self._name_cache[guild.id] = {r.name for r in guild.roles}
+        return names
+
+    async def _get_assignments(self, guild: discord.Guild) -> dict[str, dict]:
+        """Cached normalized role_assignments for this guild (loaded from Config on first use). Do not mutate."""
+        entries = self._cache.get(guild.id)
+        if entries is None:
+            # One load per guild: a second concurrent load could finish last and overwrite a newer cache entry
+            fut = self._load_futures.get(guild.id)
+            if fut is None:
+                fut = self._load_futures[guild.id] = asyncio.ensure_future(self._load_guild(guild))
+                fut.add_done_callback(lambda _: self._load_futures.pop(guild.id, None))
+            entries = await asyncio.shield(fut)
+        return entries
+
+    def _cache_entry(self, guild: discord.Guild, user_id_str: str, entry: Optional[dict]) -> None:
+        """Mirror one stored entry into the cache. entry=None means the user was removed."""
+        self._cache_entries(guild, {user_id_str: entry})
+
+    def _cache_entries(self, guild: discord.Guild, updates: dict[str, Optional[dict]]) -> None:
+        """Mirror stored entries into the cache (copy-on-write, so snapshots being iterated are never mutated)."""
+        entries = self._cache.get(guild.id)
+        if entries is None:
+            return  # not loaded yet; next read comes from Config
+        entries = dict(entries)
+        owners = self._handle_owners.setdefault(guild.id, {})
+        for user_id_str, entry in updates.items():
+            old = entries.pop(user_id_str, None)
+            if entry is not None:
+                entries[user_id_str] = entry
+            # Keep the handle-name index in step: drop the user's old names, add the new ones
+            for c in (old or {}).get("custom_roles") or []:
+                key = _name_key(c.get("name"))
+                users = owners.get(key)
+                if users is not None:
+                    users.discard(user_id_str)
+                    if not users:
+                        del owners[key]
+            for c in (entry or {}).get("custom_roles") or []:
+                owners.setdefault(_name_key(c.get("name")), set()).add(user_id_str)
+        self._cache[guild.id] = entries
+
+    async def _patch_entries(self, guild: discord.Guild, patches: dict[str, dict]) -> None:
+        """Merge field updates into users' stored entries in one Config write; a callable maps the stored value."""
+        if not patches:
+            return
+        written: dict[str, Optional[dict]] = {}
+        async with self.config.guild(guild).role_assignments() as assignments:
+            for user_id_str, fields in patches.items():
+                # Each writer only touches its own keys, applied to what is stored now rather than to an older read
+                current = _normalize_info(assignments.get(user_id_str) or {})
+                entry = dict(current)
+                for key, value in fields.items():
+                    entry[key] = value(current[key]) if callable(value) else value
+                if entry["sync_role_id"] is None and not entry["custom_roles"]:  # nothing left to track
+                    assignments.pop(user_id_str, None)
+                    written[user_id_str] = None
+                else:
+                    assignments[user_id_str] = entry
+                    written[user_id_str] = entry
+        self._cache_entries(guild, written)
+
+    async def _chunk_once(self, guild: discord.Guild, timeout: float) -> None:
+        """Chunk the guild, sharing one in-flight request between concurrent callers. Errors and timeouts are logged, not raised."""
+        fut = self._chunk_futures.get(guild.id)
+        if fut is None or fut.done():
+            fut = asyncio.ensure_future(asyncio.wait_for(guild.chunk(cache=True), timeout=timeout))
+            self._chunk_futures[guild.id] = fut
+            fut.add_done_callback(lambda _: self._chunk_futures.pop(guild.id, None))
+        try:
+            await asyncio.shield(fut)  # a cancelled caller must not cancel the chunk other callers are waiting on
+        except (discord.HTTPException, asyncio.TimeoutError) as e:
+            log.warning("UserHandle: chunking guild %s failed or timed out: %r", guild.id, e)
 
     async def _send_log_dm(self, guild: discord.Guild, message: str) -> None:
         """Send admin log to configured target: channel if set, otherwise DM user. Swallows errors."""
-        header = f"**UserHandle** — **Server:** {guild.name} (`{guild.id}`)"
-        full = f"{header}\n{message}"
+        full = f"{_log_header(guild)}\n{message}"
         log_channel_id = await self.config.guild(guild).log_channel_id()
         if log_channel_id:
             channel = guild.get_channel(log_channel_id)
@@ -130,13 +295,48 @@ class UserHandle(commands.Cog):
         except (discord.Forbidden, discord.HTTPException):
             pass
 
+    def _spawn(self, coro) -> None:
+        """Run a log-sending coroutine in the background, holding a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._pending_dms.add(task)
+        task.add_done_callback(self._pending_dms.discard)
+
+    def _queue_log_dm(self, guild: discord.Guild, message: str) -> None:
+        """Buffer an admin log message; everything queued for the guild within a few seconds goes out as one send."""
+        buffer = self._log_buffers.get(guild.id)
+        if buffer is not None:
+            buffer.append(message)  # a flush is already scheduled
+            return
+        self._log_buffers[guild.id] = [message]
+        self._spawn(self._flush_log(guild))
+
+    async def _flush_log(self, guild: discord.Guild) -> None:
+        """After the buffering window, send the guild's queued log messages."""
+        await asyncio.sleep(_LOG_FLUSH_DELAY)
+        await self._send_buffered_log(guild)
+
+    async def _send_buffered_log(self, guild: discord.Guild) -> None:
+        """Send the guild's queued log messages now, packed into as few sends as fit."""
+        messages = self._log_buffers.pop(guild.id, [])
+        # Leave room for the header line _send_log_dm puts in front of every chunk
+        limit = _MESSAGE_MAX_CHARS - len(_log_header(guild)) - 1
+        for chunk in _pack_log(messages, limit):
+            await self._send_log_dm(guild, chunk)
+
     async def _is_role_name_blacklisted(self, guild: discord.Guild, name: str) -> bool:
         """True if this role name is blacklisted (case-insensitive). Protects special/restriction roles."""
         if not (name or "").strip():
             return False
-        blacklist = await self.config.guild(guild).role_blacklist()
-        n = (name or "").strip().lower()
-        return any((b or "").strip().lower() == n for b in (blacklist or []))
+        return _name_key(name) in await self._blacklist_for(guild)
+
+    async def _blacklist_for(self, guild: discord.Guild) -> frozenset[str]:
+        """Lowered role_blacklist names, read from Config once and cached until the blacklist changes."""
+        blacklist = self._blacklist_cache.get(guild.id)
+        if blacklist is None:
+            names = await self.config.guild(guild).role_blacklist()
+            blacklist = frozenset(_name_key(b) for b in (names or []) if (b or "").strip())
+            self._blacklist_cache[guild.id] = blacklist
+        return blacklist
 
     async def _is_handle_name_taken_by_another(
         self, guild: discord.Guild, current_user_id: int, name: str
@@ -144,206 +344,302 @@ class UserHandle(commands.Cog):
         """True if another user in this guild already has this handle name in storage (case-insensitive)."""
         if not (name or "").strip():
             return False
-        want = (name or "").strip().lower()
-        assignments = await self.config.guild(guild).role_assignments()
-        for user_id_str, data in (assignments or {}).items():
-            if user_id_str == str(current_user_id):
-                continue
-            info = _normalize_info(data or {})
-            for c in info.get("custom_roles") or []:
-                if (c.get("name") or "").strip().lower() == want:
-                    return True
-        return False
+        await self._get_assignments(guild)  # loads the cache (and index) on first use
+        owners = self._handle_owners.get(guild.id, {}).get(_name_key(name))
+        return bool(owners) and bool(owners - {str(current_user_id)})
 
     def _is_role_still_in_use(
         self, assignments: dict, role_id: int, exclude_user_id: int
     ) -> bool:
-        """True if any user (except exclude_user_id) has this role_id in their custom_roles."""
-        for user_id_str, data in (assignments or {}).items():
-            if user_id_str == str(exclude_user_id):
+        """True if any user (except exclude_user_id) has this role_id in their custom_roles. Takes cached (normalized) entries."""
+        exclude_key = str(exclude_user_id)
+        for user_id_str, info in (assignments or {}).items():
+            if user_id_str == exclude_key:
                 continue
-            info = _normalize_info(data or {})
             for c in info.get("custom_roles") or []:
                 if c.get("role_id") == role_id:
                     return True
         return False
 
+    async def _set_member_roles(
+        self, member: discord.Member, add_ids: set[int] = frozenset(), *, remove_ids: set[int] = frozenset(), reason: str
+    ) -> None:
+        """Add and remove roles: per-role PUT/DELETE for one change, a single Modify Guild Member PATCH for several."""
+        current = _member_role_ids(member)
+        to_add = set(add_ids) - current
+        to_remove = set(remove_ids) & current
+        if not to_add and not to_remove:
+            return
+        # The PATCH sends the whole array from our cache, which can revert roles the gateway hasn't delivered yet
+        if Route is None or len(to_add) + len(to_remove) == 1:
+            if to_add:
+                await member.add_roles(*(discord.Object(id=rid) for rid in to_add), reason=reason)
+            if to_remove:
+                await member.remove_roles(*(discord.Object(id=rid) for rid in to_remove), reason=reason)
+            return
+        new_roles = (current | to_add) - to_remove
+        route = Route("PATCH", "/guilds/{guild_id}/members/{user_id}", guild_id=member.guild.id, user_id=member.id)
+        await self.bot.http.request(route, json={"roles": [str(r) for r in new_roles]}, reason=reason)
+
+    async def _migrate_assignments(self) -> None:
+        """Rewrite legacy role_assignments to the canonical shape and warm the caches from the same Config read."""
+        all_guilds = await self.config.all_guilds()
+        for guild_id, guild_data in all_guilds.items():
+            try:
+                data = guild_data.get("role_assignments") or {}
+                canonical = {user_id_str: _normalize_info(info or {}) for user_id_str, info in data.items()}
+                if canonical != data:
+                    await self.config.guild_from_id(guild_id).role_assignments.set(canonical)
+                    log.info("UserHandle: migrated %s role assignment(s) in guild %s to the current format", len(canonical), guild_id)
+                self._set_cache(guild_id, dict(canonical))
+                names = guild_data.get("role_blacklist") or []
+                self._blacklist_cache[guild_id] = frozenset(_name_key(b) for b in names if (b or "").strip())
+            except Exception:
+                # One bad guild shouldn't block loading; its caches fill lazily from Config on first use
+                log.exception("UserHandle: could not load stored data for guild %s", guild_id)
+
     async def cog_load(self) -> None:
+        await self._migrate_assignments()
         self.sync_role_names.start()
 
-    def cog_unload(self) -> None:
+    async def cog_unload(self) -> None:
         self.sync_role_names.cancel()
+        for task in self._join_flush_tasks.values():
+            task.cancel()
+        # Send buffered logs (e.g. a cleanup summary) now instead of dropping them; the flush tasks then find nothing
+        for guild_id in list(self._log_buffers):
+            guild = self.bot.get_guild(guild_id)
+            if guild is not None:
+                await self._send_buffered_log(guild)
 
-    @tasks.loop(minutes=5.0)
+    @tasks.loop(minutes=1.0)
     async def sync_role_names(self) -> None:
-        """Background task: update bot-managed role names to match current display names."""
+        """Background task: sync guilds marked dirty by listeners; every guild on the first pass and every ~6 h."""
         await self.bot.wait_until_ready()
         async with self._sync_lock:
-            for guild in self.bot.guilds:
-                if await self.config.guild(guild).chron_disabled():
-                    continue
-                try:
-                    result = await self._sync_guild_roles(guild)
-                    if result is not None:
-                        updated, details, errors = result
-                        log_msg = (
-                            f"**Success (chron)** — Background sync ran. {updated} user(s) affected.\n"
-                        )
-                        _max_lines = 25
-                        for i, (dname, uname, change) in enumerate(details):
-                            if i >= _max_lines:
-                                log_msg += f"\n… and {len(details) - _max_lines} more."
-                                break
-                            log_msg += f"\n• **{dname}** (username: `{uname}`): {change}."
-                        if not details:
-                            log_msg += "\n• No changes (all names already in sync)."
-                        if errors:
-                            log_msg += "\n\n**Errors (duplicate display names, skipped):**"
-                            for i, (dname, uname, err) in enumerate(errors):
-                                if i >= _max_lines:
-                                    log_msg += f"\n… and {len(errors) - _max_lines} more."
-                                    break
-                                log_msg += f"\n• **{dname}** (username: `{uname}`): {err}."
-                        await self._send_log_dm(guild, log_msg)
-                except Exception as e:
-                    log.exception("UserHandle sync failed for guild %s: %s", guild.id, e)
-                await asyncio.sleep(0.5)  # avoid hammering the API
+            full = self.sync_role_names.current_loop % _FULL_SWEEP_EVERY == 0
+            if full:
+                self._dirty_guilds.update(g.id for g in self.bot.guilds)  # warm-up / missed-event safety net
+            guilds = [g for g in map(self.bot.get_guild, self._dirty_guilds) if g is not None]
+            self._dirty_guilds.clear()  # changes arriving during this pass re-mark their guild
+            # Rate limits are per guild, so guilds can be synced concurrently (a few at a time)
+            await _gather_bounded((self._chron_guild(g, full) for g in guilds), limit=4)
+
+    async def _chron_guild(self, guild: discord.Guild, full: bool) -> None:
+        """One guild's background sync pass; its log message is sent in the background. Errors are logged, not raised."""
+        if await self.config.guild(guild).chron_disabled():
+            return
+        try:
+            result = await self._sync_guild_roles(guild, full)
+            # A dirty pass usually finds the event path already renamed the role; don't log an empty pass
+            if result is not None and (result[0] or result[2]):
+                self._queue_chron_log(guild, *result)
+        except Exception as e:
+            log.exception("UserHandle sync failed for guild %s: %s", guild.id, e)
+
+    def _queue_chron_log(
+        self, guild: discord.Guild, updated: int, details: list[tuple[str, str, str]], errors: list[tuple[str, str, str]]
+    ) -> None:
+        """Format the background pass summary and queue it for the log."""
+        header = f"**Success (chron)** — Background sync ran. {updated} user(s) affected.\n"
+        if details:
+            log_msg = _format_details(header, details)
+        else:
+            log_msg = f"{header}\n• No changes (all names already in sync)."
+        if errors:
+            log_msg += "\n\n" + _format_details("**Errors (duplicate display names, skipped):**", errors)
+        self._queue_log_dm(guild, log_msg)
 
     @sync_role_names.before_loop
     async def before_sync_role_names(self) -> None:
         await self.bot.wait_until_ready()
 
     async def _sync_guild_roles(
-        self, guild: discord.Guild
+        self, guild: discord.Guild, full: bool = True
     ) -> Optional[tuple[int, list[tuple[str, str, str]], list[tuple[str, str, str]]]]:
         """Background: only update sync (display-name) roles. Returns (updated_count, details, errors) or None if skipped."""
-        data = await self.config.guild(guild).role_assignments()
+        data = await self._get_assignments(guild)
         if not data:
             return None
-        try:
-            await asyncio.wait_for(guild.chunk(), timeout=10.0)
-        except (discord.HTTPException, asyncio.TimeoutError):
-            pass
-        existing_names = {r.name for r in guild.roles}
+        existing_names = self._names_for(guild)
+        # No guild.chunk() here: we only need tracked members, so query the missing ones by id (100 per request).
+        # Only on full sweeps: dirty passes follow events for cached members, and members who left would be re-queried every pass
+        if full and not guild.chunked:
+            missing = [int(u) for u in data if u.isdigit() and guild.get_member(int(u)) is None]
+            batches = [missing[i:i + 100] for i in range(0, len(missing), 100)]
+            # cache=True adds the results to guild's member cache, so get_member below finds them
+            results = await _gather_bounded(
+                (guild.query_members(user_ids=b, limit=100, cache=True) for b in batches), limit=2
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    log.warning("UserHandle: query_members failed for guild %s: %s", guild.id, result)
         updated = 0
         details: list[tuple[str, str, str]] = []  # (display_name, username, change_text)
         errors: list[tuple[str, str, str]] = []   # (display_name, username, error_text)
-        for user_id_str, info in list(data.items()):
+        pending: dict[str, dict] = {}  # field patches per user, merged into the stored entries once after the loop
+        api_calls: list = []  # per-member REST work, pipelined after the scan so one slow request doesn't stall the rest
+
+        def clear_if_deleted(role_id: Optional[int]) -> Optional[int]:
+            return role_id if role_id and guild.get_role(role_id) else None  # keep a sync role stored meanwhile
+
+        async def readd(role: discord.Role, member: discord.Member) -> None:
+            nonlocal updated
+            try:
+                await self._set_member_roles(member, {role.id}, reason="UserHandle: re-add sync role")
+                updated += 1
+                details.append((member.display_name, member.name, "sync role re-added to member"))
+            except (discord.Forbidden, discord.HTTPException) as e:
+                log.warning("UserHandle: could not re-add sync role %s in guild %s: %s", role.id, guild.id, e)
+
+        async def rename(role: discord.Role, member: discord.Member, new_name: str) -> None:
+            nonlocal updated
+            try:
+                await role.edit(name=new_name, reason="UserHandle: sync display name")
+                updated += 1
+                details.append((member.display_name, member.name, f"sync role renamed to **{new_name}**"))
+            except (discord.Forbidden, discord.HTTPException) as e:
+                _release_name(existing_names, guild, new_name, role.id)  # release the name reserved during the scan
+                existing_names.add(role.name)
+                log.warning("UserHandle: could not rename sync role %s in guild %s: %s", role.id, guild.id, e)
+            if not _has_role(member, role.id):
+                try:
+                    await self._set_member_roles(member, {role.id}, reason="UserHandle: re-add sync role")
+                except (discord.Forbidden, discord.HTTPException) as e:
+                    log.warning("UserHandle: could not re-add sync role %s in guild %s: %s", role.id, guild.id, e)
+
+        # data is a copy-on-write snapshot, so it can be iterated directly across awaits
+        for i, (user_id_str, info) in enumerate(data.items()):
+            if i % 50 == 0:
+                await asyncio.sleep(0)  # stay responsive on large guilds even when nothing needs an API call
             try:
-                info = _normalize_info(info)
                 sync_role_id = info.get("sync_role_id")
                 if not sync_role_id:
                     continue
                 role = guild.get_role(sync_role_id)
                 if not role:
-                    async with self.config.guild(guild).role_assignments() as assignments:
-                        a = _normalize_info(assignments.get(user_id_str) or {})
-                        a["sync_role_id"] = None
-                        if a.get("custom_roles"):
-                            assignments[user_id_str] = {"sync_role_id": a.get("sync_role_id"), "custom_roles": a.get("custom_roles")}
-                        else:
-                            assignments.pop(user_id_str, None)
+                    pending[user_id_str] = {"sync_role_id": clear_if_deleted}  # users left with nothing are dropped
                     continue
                 member = guild.get_member(int(user_id_str))
                 if not member:
-                    continue
-                desired_name = (_display_name(member) or member.name).strip() or member.name
-                dname, uname = member.display_name, member.name
+                    continue  # left the guild or not fetchable
+                dname, uname = member.display_name, member.name  # properties; read once per member
+                desired_name = (dname or uname).strip() or uname
                 if role.name == desired_name:
-                    if not member.get_role(sync_role_id):
-                        try:
-                            await member.add_roles(role, reason="UserHandle: re-add sync role")
-                            updated += 1
-                            details.append((dname, uname, "sync role re-added to member"))
-                        except (discord.Forbidden, discord.HTTPException):
-                            pass
+                    if not _has_role(member, sync_role_id):
+                        api_calls.append(readd(role, member))
                     continue
-                unique_name = self._unique_role_name(guild, desired_name, existing_names, exclude_role=role)
-                if unique_name != desired_name:
+                if desired_name in existing_names:  # role.name == desired_name was handled above
                     errors.append((dname, uname, f"Duplicate display name '{desired_name}', skipped"))
                     continue
-                try:
-                    await role.edit(name=unique_name, reason="UserHandle: sync display name")
-                    existing_names.discard(role.name)
-                    existing_names.add(unique_name)
-                    updated += 1
-                    details.append((dname, uname, f"sync role renamed to **{unique_name}**"))
-                except (discord.Forbidden, discord.HTTPException):
-                    pass
-                if not member.get_role(sync_role_id):
-                    try:
-                        await member.add_roles(role, reason="UserHandle: re-add sync role")
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass
+                # Reserve the new name now so later members in this scan see it as taken
+                _release_name(existing_names, guild, role.name, role.id)
+                existing_names.add(desired_name)
+                api_calls.append(rename(role, member, desired_name))
             except (ValueError, KeyError):
                 pass
-            await asyncio.sleep(0.2)
+        # Each call handles its own HTTP errors; discord.py still enforces per-bucket limits
+        for result in await _gather_bounded(api_calls, limit=8):
+            if isinstance(result, Exception):
+                log.error("UserHandle: background sync call failed in guild %s", guild.id, exc_info=result)
+        await self._patch_entries(guild, pending)
         return (updated, details, errors)
 
-    def _unique_role_name(
+    async def _run_once(self, key: tuple, make_coro, member: discord.Member, assign: bool) -> Optional[discord.Role]:
+        """Run make_coro() unless an identical ensure is already in flight, in which case await that one instead."""
+        task = self._inflight_ensure.get(key)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(make_coro())
+            self._inflight_ensure[key] = task
+            task.add_done_callback(lambda _: self._inflight_ensure.pop(key, None))
+        role = await asyncio.shield(task)  # one cancelled caller must not cancel the work others are waiting on
+        # A caller that joined someone else's run still gets the role assigned if it asked for that
+        if joined and assign and role is not None and not _has_role(member, role.id):
+            try:
+                await self._set_member_roles(member, {role.id}, reason="UserHandle: assign role")
+            except (discord.Forbidden, discord.HTTPException) as e:
+                if self._last_sync_error is None:
+                    self._last_sync_error = str(e)
+        return role
+
+    async def _ensure_sync_role(
         self,
         guild: discord.Guild,
-        base_name: str,
+        member: discord.Member,
         existing_names: Optional[set[str]] = None,
         *,
-        exclude_role: Optional[discord.Role] = None,
-    ) -> str:
-        """Return a role name that does not already exist in the guild."""
-        if existing_names is None:
-            existing_names = {r.name for r in guild.roles}
-        if exclude_role and exclude_role.name in existing_names:
-            existing_names = existing_names - {exclude_role.name}
-        if base_name not in existing_names:
-            return base_name
-        i = 2
-        while f"{base_name} ({i})" in existing_names:
-            i += 1
-        return f"{base_name} ({i})"
-
-    async def _ensure_sync_role(self, guild: discord.Guild, member: discord.Member) -> Optional[discord.Role]:
-        """Create or update only the sync (display-name) role for this member. Only touches roles we created (in config)."""
+        assign: bool = True,
+        pending: Optional[dict[str, dict]] = None,
+    ) -> Optional[discord.Role]:
+        """Create or update only the sync (display-name) role for this member; concurrent calls for a member share one run."""
+        return await self._run_once(
+            ("sync", guild.id, member.id),
+            lambda: self._ensure_sync_role_impl(guild, member, existing_names, assign=assign, pending=pending),
+            member,
+            assign,
+        )
+
+    async def _ensure_sync_role_impl(
+        self,
+        guild: discord.Guild,
+        member: discord.Member,
+        existing_names: Optional[set[str]],
+        *,
+        assign: bool,
+        pending: Optional[dict[str, dict]],
+    ) -> Optional[discord.Role]:
         user_id_str = str(member.id)
-        async with self.config.guild(guild).role_assignments() as assignments:
-            info = _normalize_info(assignments.get(user_id_str) or {})
-            sync_role_id = info.get("sync_role_id")
+        info = (await self._get_assignments(guild)).get(user_id_str) or _normalize_info({})
+        sync_role_id = info.get("sync_role_id")
         name_to_use = (_display_name(member) or member.name).strip() or member.name
-        existing_names = {r.name for r in guild.roles}
         role = guild.get_role(sync_role_id) if sync_role_id else None
+        if role is not None and role.name == name_to_use and _has_role(member, role.id):
+            return role  # already in sync: no name scan, no Config write, no API call
+        if existing_names is None:
+            existing_names = self._names_for(guild)
         if role is None:
-            unique_name = self._unique_role_name(guild, name_to_use, existing_names)
-            if unique_name != name_to_use:
+            if name_to_use in existing_names:
                 if self._last_sync_error is None:
                     self._last_sync_error = f"Duplicate display name: '{name_to_use}' already in use"
                 return None
+            existing_names.add(name_to_use)  # reserve before the await so concurrent calls sharing the set see it taken
             try:
                 role = await guild.create_role(
-                    name=unique_name,
+                    name=name_to_use,
                     reason="UserHandle: create sync role",
                 )
             except (discord.Forbidden, discord.HTTPException) as e:
+                _release_name(existing_names, guild, name_to_use)
                 log.warning("UserHandle: could not create sync role in guild %s: %s", guild.id, e)
                 if self._last_sync_error is None:
                     self._last_sync_error = str(e)
                 return None
-            existing_names.add(role.name)
-            async with self.config.guild(guild).role_assignments() as assignments:
-                entry = _normalize_info(assignments.get(user_id_str) or {})
-                entry["sync_role_id"] = role.id
-                assignments[user_id_str] = {"sync_role_id": entry.get("sync_role_id"), "custom_roles": entry.get("custom_roles", [])}
+            fields = {"sync_role_id": role.id}  # the only key this path owns
+            # With pending, cache now and let the caller write every member's fields in one Config write
+            if pending is None:
+                await self._patch_entries(guild, {user_id_str: fields})
+            else:
+                entry = (await self._get_assignments(guild)).get(user_id_str) or info
+                self._cache_entry(guild, user_id_str, {**entry, **fields})
+                pending[user_id_str] = fields
         else:
             if role.name != name_to_use:
-                unique_name = self._unique_role_name(guild, name_to_use, existing_names, exclude_role=role)
-                if unique_name != name_to_use:
+                if name_to_use in existing_names:  # role.name != name_to_use here
                     if self._last_sync_error is None:
                         self._last_sync_error = f"Duplicate display name: '{name_to_use}' already in use"
                     return role
+                old_name = role.name
                 try:
-                    await role.edit(name=unique_name, reason="UserHandle: sync display name")
+                    await role.edit(name=name_to_use, reason="UserHandle: sync display name")
+                    _release_name(existing_names, guild, old_name, role.id)
+                    existing_names.add(name_to_use)
                 except (discord.Forbidden, discord.HTTPException):
                     pass
+        if not assign:
+            return role  # the caller assigns it, e.g. together with other roles
         try:
-            if not member.get_role(role.id):
-                await member.add_roles(role, reason="UserHandle: assign sync role")
+            await self._set_member_roles(member, {role.id}, reason="UserHandle: assign sync role")
         except (discord.Forbidden, discord.HTTPException) as e:
             if self._last_sync_error is None:
                 self._last_sync_error = str(e)
@@ -351,44 +647,65 @@ class UserHandle(commands.Cog):
         return role
 
     async def _ensure_custom_role(
-        self, guild: discord.Guild, member: discord.Member, custom_name: str
+        self,
+        guild: discord.Guild,
+        member: discord.Member,
+        custom_name: str,
+        existing_names: Optional[set[str]] = None,
+        *,
+        assign: bool = True,
     ) -> Optional[discord.Role]:
         """Add a new custom handle role. Only roles we CREATE are tracked; we never adopt existing server roles (e.g. restriction roles)."""
         custom_name = (custom_name or "").strip() or member.name
+        return await self._run_once(
+            ("custom", guild.id, member.id, _name_key(custom_name)),
+            lambda: self._ensure_custom_role_impl(guild, member, custom_name, existing_names, assign=assign),
+            member,
+            assign,
+        )
+
+    async def _ensure_custom_role_impl(
+        self,
+        guild: discord.Guild,
+        member: discord.Member,
+        custom_name: str,
+        existing_names: Optional[set[str]],
+        *,
+        assign: bool,
+    ) -> Optional[discord.Role]:
         if await self._is_role_name_blacklisted(guild, custom_name):
             return None  # Caller should check and send a friendly message
         user_id_str = str(member.id)
-        async with self.config.guild(guild).role_assignments() as assignments:
-            info = _normalize_info(assignments.get(user_id_str) or {})
-            custom_roles = list(info.get("custom_roles") or [])
+        info = (await self._get_assignments(guild)).get(user_id_str) or _normalize_info({})
+        custom_roles = list(info.get("custom_roles") or [])
         # Only roles in custom_roles were created by us; if user already has one with this name, ensure they have it
         for c in custom_roles:
             rid = c.get("role_id")
             if rid and c.get("name") == custom_name:
                 role = guild.get_role(rid)
-                if role and not member.get_role(rid):
+                if role and assign and not _has_role(member, rid):
                     try:
-                        await member.add_roles(role, reason="UserHandle: assign custom handle")
+                        await self._set_member_roles(member, {rid}, reason="UserHandle: assign custom handle")
                     except (discord.Forbidden, discord.HTTPException) as e:
                         if self._last_sync_error is None:
                             self._last_sync_error = str(e)
                 return role
         # Never create a role when the requested name is blacklisted (e.g. don't create "Moderator (2)" if "Moderator" is blacklisted)
-        existing_names = {r.name for r in guild.roles}
-        unique_name = self._unique_role_name(guild, custom_name, existing_names)
-        if await self._is_role_name_blacklisted(guild, unique_name):
+        if existing_names is None:
+            existing_names = self._names_for(guild)
+        # Never create "Name (2)" — if name is taken, fail (caller should have checked existing_role_names)
+        if custom_name in existing_names:
             return None
-        # Base name (before any " (2)" suffix) must also be blacklist-checked so we never create blacklisted-name (2)
-        base_name = unique_name.split(" (")[0].strip() if " (" in unique_name else unique_name
-        if await self._is_role_name_blacklisted(guild, base_name):
+        if await self._is_role_name_blacklisted(guild, custom_name):
             return None
-        # Never create "Name (2)" — if name is taken, fail (caller should have checked existing_role_names)
-        if unique_name != custom_name:
+        # Base name (before any " (2)" suffix) must also be blacklist-checked so "Moderator (2)" can't slip through
+        base_name = custom_name.split(" (")[0].strip() if " (" in custom_name else custom_name
+        if await self._is_role_name_blacklisted(guild, base_name):
             return None
         # Create new role and add to tracked list only when we create it (never adopt existing server roles)
         try:
             role = await guild.create_role(
-                name=unique_name,
+                name=custom_name,
                 reason="UserHandle: create custom handle",
             )
         except (discord.Forbidden, discord.HTTPException) as e:
@@ -396,14 +713,13 @@ class UserHandle(commands.Cog):
             if self._last_sync_error is None:
                 self._last_sync_error = str(e)
             return None
-        custom_roles.append({"role_id": role.id, "name": role.name})
-        async with self.config.guild(guild).role_assignments() as assignments:
-            entry = _normalize_info(assignments.get(user_id_str) or {})
-            entry["custom_roles"] = custom_roles
-            assignments[user_id_str] = {"sync_role_id": entry.get("sync_role_id"), "custom_roles": entry["custom_roles"]}
+        existing_names.add(role.name)
+        new_handle = {"role_id": role.id, "name": role.name}
+        await self._patch_entries(guild, {user_id_str: {"custom_roles": lambda stored: [*stored, new_handle]}})
+        if not assign:
+            return role  # the caller assigns it, e.g. together with other roles
         try:
-            if not member.get_role(role.id):
-                await member.add_roles(role, reason="UserHandle: assign custom handle")
+            await self._set_member_roles(member, {role.id}, reason="UserHandle: assign custom handle")
         except (discord.Forbidden, discord.HTTPException) as e:
             if self._last_sync_error is None:
                 self._last_sync_error = str(e)
@@ -479,34 +795,52 @@ class UserHandle(commands.Cog):
         if len(name) > 100:
             await ctx.send("Name must be 100 characters or fewer.")
             return
-        sync_role = await self._ensure_sync_role(ctx.guild, ctx.author)
+        existing_names = self._names_for(ctx.guild)
+        sync_role = await self._ensure_sync_role(ctx.guild, ctx.author, existing_names, assign=False)
         if sync_role is None:
             await ctx.send("I couldn't create or update your display-name role. Check that my role is above the roles I create and I have *Manage Roles*.")
             return
-        if await self._is_role_name_blacklisted(ctx.guild, name):
-            await ctx.send("That handle is blacklisted by server admins and can't be used.")
-            return
-        if await self._is_handle_name_taken_by_another(ctx.guild, ctx.author.id, name):
-            await ctx.send("That handle is already in use by another member.")
-            return
-        # Reject if name already exists as a role (would otherwise create "Name (2)")
-        existing_role_names = {r.name.strip().lower() for r in ctx.guild.roles}
-        if name.strip().lower() in existing_role_names:
-            await ctx.send("That handle is already in use. Choose a different name.")
-            return
-        custom_role = await self._ensure_custom_role(ctx.guild, ctx.author, name)
-        if custom_role is None:
-            # Distinguish blacklist (don't create Name (2)) from other failures
+        # Hold the name's lock from the checks through creation so two members can't both claim it
+        custom_role = None
+        async with self._lock_for(ctx.guild.id, name):
             if await self._is_role_name_blacklisted(ctx.guild, name):
-                await ctx.send("That handle is blacklisted by server admins and can't be used.")
+                error = "That handle is blacklisted by server admins and can't be used."
+            elif await self._is_handle_name_taken_by_another(ctx.guild, ctx.author.id, name):
+                error = "That handle is already in use by another member."
+            # Reject if name already exists as a role (would otherwise create "Name (2)")
+            elif any(_name_key(n) == _name_key(name) for n in existing_names):
+                error = "That handle is already in use. Choose a different name."
             else:
-                await ctx.send("I couldn't create or update your custom handle. Check permissions.")
+                custom_role = await self._ensure_custom_role(ctx.guild, ctx.author, name, existing_names, assign=False)
+                # Distinguish blacklist (don't create Name (2)) from other failures
+                if custom_role is not None:
+                    error = None
+                elif await self._is_role_name_blacklisted(ctx.guild, name):
+                    error = "That handle is blacklisted by server admins and can't be used."
+                else:
+                    error = "I couldn't create or update your custom handle. Check permissions."
+        if custom_role is None:
+            # The handle failed, but the display-name role was deferred to the combined assignment; give it now
+            try:
+                await self._set_member_roles(ctx.author, {sync_role.id}, reason="UserHandle: assign sync role")
+            except (discord.Forbidden, discord.HTTPException) as e:
+                log.warning("UserHandle: could not assign sync role to %s in guild %s: %s", ctx.author.id, ctx.guild.id, e)
+            await ctx.send(error)
             return
-        info = _normalize_info((await self.config.guild(ctx.guild).role_assignments()).get(str(ctx.author.id)) or {})
+        # Both roles in one PATCH when both are new; a lone missing role goes out as a per-role PUT
+        try:
+            await self._set_member_roles(
+                ctx.author, {sync_role.id, custom_role.id}, reason="UserHandle: assign sync role and custom handle"
+            )
+        except (discord.Forbidden, discord.HTTPException) as e:
+            log.warning("UserHandle: could not assign roles to %s in guild %s: %s", ctx.author.id, ctx.guild.id, e)
+            await ctx.send("I created your handle but couldn't assign it to you. Check that my role is above it and I have *Manage Roles*.")
+            return
+        info = (await self._get_assignments(ctx.guild)).get(str(ctx.author.id)) or _normalize_info({})
         custom_names = [c.get("name") for c in (info.get("custom_roles") or []) if c.get("name")]
         custom_txt = ", ".join(f"**{n}**" for n in custom_names) if custom_names else custom_role.name
         await ctx.send(f"Added **{custom_role.name}**. You now have: **{sync_role.name}** (display name) and {custom_txt} (custom handle(s)).")
-        await self._send_log_dm(
+        self._queue_log_dm(
             ctx.guild,
             f"**Success (set)** — Custom handle added (no other tags removed).\n"
             f"• **User affected:** {ctx.author.display_name} (username: `{ctx.author.name}`, id: `{ctx.author.id}`)\n"
@@ -517,45 +851,44 @@ class UserHandle(commands.Cog):
     async def userhandle_clear(self, ctx: commands.Context) -> None:
         """Remove all your custom handle roles. Your display-name role is kept and will stay in sync."""
         user_id_str = str(ctx.author.id)
-        async with self.config.guild(ctx.guild).role_assignments() as assignments:
-            info = _normalize_info(assignments.get(user_id_str) or {})
-            custom_roles = list(info.get("custom_roles") or [])
-            if not custom_roles:
-                await ctx.send("You don't have any custom handles set in this server.")
-                return
-            removed_names = []
-            for c in custom_roles:
-                rid = c.get("role_id")
-                name = c.get("name", "?")
-                if rid:
-                    role = ctx.guild.get_role(rid)
-                    if role and ctx.author.get_role(rid):
-                        try:
-                            await ctx.author.remove_roles(role, reason="UserHandle: clear custom handle")
-                            removed_names.append(name)
-                        except (discord.Forbidden, discord.HTTPException):
-                            pass
-            entry = _normalize_info(assignments.get(user_id_str) or {})
-            entry["custom_roles"] = []
-            if entry.get("sync_role_id") is None:
-                assignments.pop(user_id_str, None)
-            else:
-                assignments[user_id_str] = {"sync_role_id": entry["sync_role_id"], "custom_roles": []}
-            # Delete roles from Discord if no other user has them
-            for c in custom_roles:
-                rid = c.get("role_id")
-                if not rid or self._is_role_still_in_use(assignments, rid, ctx.author.id):
-                    continue
-                role = ctx.guild.get_role(rid)
-                if role:
-                    try:
-                        await role.delete(reason="UserHandle: handle cleared, no other users")
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass
+        # Read from the cache and do the Discord calls outside any Config context; only the final write touches Config
+        info = (await self._get_assignments(ctx.guild)).get(user_id_str) or _normalize_info({})
+        custom_roles = list(info.get("custom_roles") or [])
+        if not custom_roles:
+            await ctx.send("You don't have any custom handles set in this server.")
+            return
+        # All held handles come off in one PATCH rather than one request per role
+        held = [c for c in custom_roles if c.get("role_id") and _has_role(ctx.author, c["role_id"])]
+        removed_names = []
+        if held:
+            try:
+                await self._set_member_roles(
+                    ctx.author, remove_ids={c["role_id"] for c in held}, reason="UserHandle: clear custom handle"
+                )
+                removed_names = [c.get("name", "?") for c in held]
+            except (discord.Forbidden, discord.HTTPException):
+                pass
+        # Applied to the stored list, so a handle added meanwhile is kept
+        cleared_ids = {c.get("role_id") for c in custom_roles}
+        await self._patch_entries(
+            ctx.guild, {user_id_str: {"custom_roles": lambda stored: [c for c in stored if c.get("role_id") not in cleared_ids]}}
+        )
+        # Delete roles from Discord if no other user has them
+        assignments = await self._get_assignments(ctx.guild)
+        for c in custom_roles:
+            rid = c.get("role_id")
+            if not rid or self._is_role_still_in_use(assignments, rid, ctx.author.id):
+                continue
+            role = ctx.guild.get_role(rid)
+            if role:
+                try:
+                    await role.delete(reason="UserHandle: handle cleared, no other users")
+                except (discord.Forbidden, discord.HTTPException):
+                    pass
         n = len(removed_names)
         await ctx.send(f"Custom handle(s) removed ({n} role(s)). Your display-name role is unchanged and will keep syncing.")
         names_txt = ", ".join(f"**{x}**" for x in removed_names) if removed_names else "—"
-        await self._send_log_dm(
+        self._queue_log_dm(
             ctx.guild,
             f"**Success (clear)** — Custom handle(s) removed.\n"
             f"• **User affected:** {ctx.author.display_name} (username: `{ctx.author.name}`, id: `{ctx.author.id}`)\n"
@@ -570,49 +903,44 @@ class UserHandle(commands.Cog):
             await ctx.send("Please provide the name of the custom handle to remove.")
             return
         user_id_str = str(ctx.author.id)
-        async with self.config.guild(ctx.guild).role_assignments() as assignments:
-            info = _normalize_info(assignments.get(user_id_str) or {})
-            custom_roles = list(info.get("custom_roles") or [])
-            # Only remove if this role is in our tracked list (created by set)
-            match_idx = None
-            for i, c in enumerate(custom_roles):
-                if (c.get("name") or "").strip() == name:
-                    match_idx = i
-                    break
-            if match_idx is None:
-                tracked = [c.get("name") for c in custom_roles if c.get("name")]
-                if not tracked:
-                    await ctx.send("You don't have any custom handles from this bot. Use `!userhandle set <name>` to add one.")
-                else:
-                    await ctx.send(
-                        f"**{name}** isn't in your tracked handles. You can only remove handles you added with `!userhandle set`. "
-                        f"Your tracked handles: {', '.join(f'**{n}**' for n in tracked)}."
-                    )
-                return
-            rid = custom_roles[match_idx].get("role_id")
-            role = ctx.guild.get_role(rid) if rid else None
-            if role and ctx.author.get_role(rid):
-                try:
-                    await ctx.author.remove_roles(role, reason="UserHandle: remove custom handle")
-                except (discord.Forbidden, discord.HTTPException):
-                    await ctx.send("I don't have permission to remove that role from you.")
-                    return
-            new_list = [c for i, c in enumerate(custom_roles) if i != match_idx]
-            entry = _normalize_info(assignments.get(user_id_str) or {})
-            entry["custom_roles"] = new_list
-            if not new_list and entry.get("sync_role_id") is None:
-                assignments.pop(user_id_str, None)
+        # Same phases as clear: read from the cache, call Discord outside any Config context, then write once
+        info = (await self._get_assignments(ctx.guild)).get(user_id_str) or _normalize_info({})
+        custom_roles = list(info.get("custom_roles") or [])
+        # Only remove if this role is in our tracked list (created by set)
+        match_idx = None
+        for i, c in enumerate(custom_roles):
+            if (c.get("name") or "").strip() == name:
+                match_idx = i
+                break
+        if match_idx is None:
+            tracked = [c.get("name") for c in custom_roles if c.get("name")]
+            if not tracked:
+                await ctx.send("You don't have any custom handles from this bot. Use `!userhandle set <name>` to add one.")
             else:
-                assignments[user_id_str] = {"sync_role_id": entry.get("sync_role_id"), "custom_roles": new_list}
-            # Delete role from Discord if no other user has it
-            if rid and not self._is_role_still_in_use(assignments, rid, ctx.author.id):
-                if role:
-                    try:
-                        await role.delete(reason="UserHandle: handle removed, no other users")
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass
+                await ctx.send(
+                    f"**{name}** isn't in your tracked handles. You can only remove handles you added with `!userhandle set`. "
+                    f"Your tracked handles: {', '.join(f'**{n}**' for n in tracked)}."
+                )
+            return
+        rid = custom_roles[match_idx].get("role_id")
+        role = ctx.guild.get_role(rid) if rid else None
+        if role and _has_role(ctx.author, rid):
+            try:
+                await self._set_member_roles(ctx.author, remove_ids={rid}, reason="UserHandle: remove custom handle")
+            except (discord.Forbidden, discord.HTTPException):
+                await ctx.send("I don't have permission to remove that role from you.")
+                return
+        await self._patch_entries(
+            ctx.guild, {user_id_str: {"custom_roles": lambda stored: [c for c in stored if c.get("role_id") != rid]}}
+        )
+        # Delete role from Discord if no other user has it
+        if rid and role and not self._is_role_still_in_use(await self._get_assignments(ctx.guild), rid, ctx.author.id):
+            try:
+                await role.delete(reason="UserHandle: handle removed, no other users")
+            except (discord.Forbidden, discord.HTTPException):
+                pass
         await ctx.send(f"Removed custom handle **{name}**. Your display-name role is unchanged.")
-        await self._send_log_dm(
+        self._queue_log_dm(
             ctx.guild,
             f"**Success (remove)** — One custom handle removed.\n"
             f"• **User affected:** {ctx.author.display_name} (username: `{ctx.author.name}`, id: `{ctx.author.id}`)\n"
@@ -641,11 +969,12 @@ class UserHandle(commands.Cog):
             await ctx.send("Please provide a role name to blacklist.")
             return
         bl = list(await self.config.guild(ctx.guild).role_blacklist() or [])
-        if name.lower() in [b.strip().lower() for b in bl if b]:
+        if _name_key(name) in {_name_key(b) for b in bl if b}:
             await ctx.send(f"**{name}** is already on the blacklist.")
             return
         bl.append(name)
         await self.config.guild(ctx.guild).role_blacklist.set(bl)
+        self._blacklist_cache.pop(ctx.guild.id, None)
         await ctx.send(f"**{name}** is now reserved. The bot will not create or track custom handles with this name.")
 
     @userhandle_blacklist.command(name="remove")
@@ -657,11 +986,12 @@ class UserHandle(commands.Cog):
             await ctx.send("Please provide a role name to remove from the blacklist.")
             return
         bl = list(await self.config.guild(ctx.guild).role_blacklist() or [])
-        new_bl = [b for b in bl if (b or "").strip().lower() != name.lower()]
+        new_bl = [b for b in bl if _name_key(b) != _name_key(name)]
         if len(new_bl) == len(bl):
             await ctx.send(f"**{name}** was not on the blacklist.")
             return
         await self.config.guild(ctx.guild).role_blacklist.set(new_bl)
+        self._blacklist_cache.pop(ctx.guild.id, None)
         await ctx.send(f"**{name}** removed from the blacklist.")
 
     @userhandle.command(name="logdm")
@@ -673,13 +1003,13 @@ class UserHandle(commands.Cog):
             await self.config.guild(ctx.guild).log_dm_user_id.set(None)
             await ctx.send("DM logging is now **off** for this server. You will not receive DMs for UserHandle actions.")
         else:
-            await self.config.guild(ctx.guild).log_channel_id.set(None)  # switch from channel to DM
-            await self.config.guild(ctx.guild).log_dm_user_id.set(ctx.author.id)
+            conf = self.config.guild(ctx.guild)
+            await asyncio.gather(conf.log_channel_id.set(None), conf.log_dm_user_id.set(ctx.author.id))  # switch from channel to DM
             await ctx.send(
                 "DM logging is now **on** for this server. You'll receive a DM for:\n"
                 "• **set** – who set a custom handle and the role names\n"
                 "• **clear** / **remove** – who cleared or removed handles\n"
-                "• **chron** – background sync (every ~5 min) summary"
+                "• **chron** – background sync summary (servers with name changes, plus a full sweep every ~6 h)"
             )
 
     @userhandle.command(name="logchannel")
@@ -697,8 +1027,8 @@ class UserHandle(commands.Cog):
                     "To get logs in DMs instead, run: `!userhandle logdm`."
                 )
             return
-        await self.config.guild(ctx.guild).log_dm_user_id.set(None)  # switch from DM to channel
-        await self.config.guild(ctx.guild).log_channel_id.set(channel.id)
+        conf = self.config.guild(ctx.guild)
+        await asyncio.gather(conf.log_dm_user_id.set(None), conf.log_channel_id.set(channel.id))  # switch from DM to channel
         await ctx.send(
             f"UserHandle logs will now be sent to {channel.mention}. You'll see set/clear/remove and chron (background sync) there. "
             "Use `!userhandle logchannel` with no channel to turn this off, or `!userhandle logdm` to switch to DMs."
@@ -710,20 +1040,48 @@ class UserHandle(commands.Cog):
         """[Admin] Ensure every member has a tag role and names are in sync. Run this after enabling the cog on a server with existing members."""
         self._last_sync_error = None
         await ctx.send(f"Syncing tag roles for all members… This may take a while. (cog v{__version__})")
-        # Try cache first (chunk with timeout so we don't hang on slow gateway)
-        try:
-            await asyncio.wait_for(ctx.guild.chunk(), timeout=15.0)
-        except (discord.HTTPException, asyncio.TimeoutError):
-            pass
-        members_list = [m for m in ctx.guild.members if not m.bot]
+        # Try cache first; only chunk when the gateway hasn't already delivered the member list
+        if not ctx.guild.chunked:
+            await self._chunk_once(ctx.guild, timeout=15.0)
+        # Only create/update sync (display-name) roles. Custom handles are never touched.
+        # Members are independent; run them concurrently and let discord.py's HTTP client handle 429s.
+        data = await self._get_assignments(ctx.guild)
+        existing_names = self._names_for(ctx.guild)  # shared and kept current by every call
+        # Tasks start as members arrive (so REST paging overlaps role work), capped like _gather_bounded
+        sem = asyncio.Semaphore(8)
+        pending: dict[str, dict] = {}  # new sync-role fields per member, merged into Config once at the end
+        seen = 0
+        up_to_date = 0
+        member_tasks: list[tuple[discord.Member, asyncio.Task]] = []
+
+        def submit(m: discord.Member) -> None:
+            """Start work for one member right away, unless their sync role is already correct."""
+            nonlocal seen, up_to_date
+            seen += 1
+            info = data.get(str(m.id))
+            role = ctx.guild.get_role(info.get("sync_role_id") or 0) if info else None
+            if role is not None and role.name == _display_name(m) and _has_role(m, role.id):
+                up_to_date += 1
+                return
+            ensure = self._ensure_sync_role(ctx.guild, m, existing_names, pending=pending)
+            member_tasks.append((m, asyncio.create_task(_bounded(sem, ensure))))
+
+        for m in ctx.guild.members:
+            if not m.bot:
+                submit(m)
         rest_used = False
-        if not members_list:
+        if not seen:
             await ctx.send(f"Cache empty or chunk timed out; fetching members via API… (cog v{__version__})")
-            rest_members = await _fetch_guild_members_via_rest(self.bot, ctx.guild)
-            if rest_members:
-                members_list = rest_members
-                rest_used = True
-        if not members_list:
+            try:
+                # discord.py paginates GET /guilds/{id}/members; members are submitted as each page arrives,
+                # so role work overlaps the next page's download
+                async for m in ctx.guild.fetch_members(limit=None):
+                    if not m.bot:
+                        submit(m)
+            except (discord.ClientException, discord.HTTPException) as e:
+                log.warning("UserHandle: REST fetch_members failed for guild %s: %s", ctx.guild.id, e)
+            rest_used = bool(seen)
+        if not seen:
             total = ctx.guild.member_count or 0
             await ctx.send(
                 f"Could not get the member list (cache and REST both failed or returned 0). "
@@ -732,23 +1090,26 @@ class UserHandle(commands.Cog):
                 "If the problem persists, push the latest cog code to GitHub and run `!repo update dc-red-role-bot` then `!cog update user_handle`."
             )
             return
-        # Only create/update sync (display-name) roles. Custom handles are never touched.
+        try:
+            results = await asyncio.gather(*(t for _, t in member_tasks), return_exceptions=True)
+        finally:
+            await self._patch_entries(ctx.guild, pending)
         created = 0
-        for member in members_list:
-            try:
-                role = await self._ensure_sync_role(ctx.guild, member)
-                if role is not None:
-                    created += 1
-            except Exception as e:
-                log.exception("UserHandle: sync failed for member %s: %s", member.id, e)
+        for (member, _), result in zip(member_tasks, results):
+            if isinstance(result, Exception):
+                log.error("UserHandle: sync failed for member %s", member.id, exc_info=result)
                 if self._last_sync_error is None:
-                    self._last_sync_error = str(e)
-            await asyncio.sleep(0.3)
-        msg = f"Sync complete. Display-name roles ensured for {created} non-bot members (custom handles left unchanged). (cog v{__version__})"
+                    self._last_sync_error = str(result)
+            elif result is not None:
+                created += 1
+        msg = (
+            f"Sync complete. Display-name roles ensured for {created} non-bot members; "
+            f"{up_to_date} were already in sync (custom handles left unchanged). (cog v{__version__})"
+        )
         if rest_used:
             msg += " (used API fallback)"
         sync_error = self._last_sync_error
-        if members_list and created == 0:
+        if member_tasks and created == 0:
             msg += " — No roles were created: check that the bot has **Manage Roles** and its role is **above** the roles it creates in Server settings → Roles."
             if sync_error:
                 msg += f" Discord error: `{sync_error}`"
@@ -761,14 +1122,13 @@ class UserHandle(commands.Cog):
     async def userhandle_cleanup(self, ctx: commands.Context) -> None:
         """[Admin] Remove all UserHandle roles in this server and turn off the background chron for this server."""
         guild = ctx.guild
-        assignments = await self.config.guild(guild).role_assignments()
+        assignments = await self._get_assignments(guild)
         if not assignments:
             await ctx.send("There are no UserHandle role assignments in this server. Chron is already effectively off for this server.")
             return
         # Collect all role IDs we created (sync + custom)
         role_ids = set()
-        for user_id_str, data in assignments.items():
-            info = _normalize_info(data or {})
+        for info in assignments.values():
             sid = info.get("sync_role_id")
             if sid:
                 role_ids.add(sid)
@@ -786,15 +1146,15 @@ class UserHandle(commands.Cog):
                     deleted += 1
                 except (discord.Forbidden, discord.HTTPException):
                     failed += 1
-            await asyncio.sleep(0.2)
         await self.config.guild(guild).role_assignments.set({})
+        self._set_cache(guild.id, {})
         await self.config.guild(guild).chron_disabled.set(True)
         msg = (
             f"**Cleanup done.** Deleted {deleted} role(s), failed to delete {failed}. "
             "All UserHandle data for this server has been cleared and the background chron will skip this server."
         )
         await ctx.send(msg)
-        await self._send_log_dm(
+        self._queue_log_dm(
             guild,
             f"**Success (cleanup)** — Admin ran cleanup in this server.\n"
             f"• Roles deleted: {deleted}, failed: {failed}. Chron disabled for this server."
@@ -811,7 +1171,7 @@ class UserHandle(commands.Cog):
     async def userhandle_chron_on(self, ctx: commands.Context) -> None:
         """[Admin] Re-enable the background chron for this server (e.g. after cleanup)."""
         await self.config.guild(ctx.guild).chron_disabled.set(False)
-        await ctx.send("Background sync (chron) is now **on** for this server. Display-name roles will be updated every ~5 minutes.")
+        await ctx.send("Background sync (chron) is now **on** for this server. Display-name roles will follow nickname changes again.")
 
     @userhandle_chron.command(name="off")
     @commands.admin_or_permissions(manage_roles=True)
@@ -825,4 +1185,121 @@ class UserHandle(commands.Cog):
         """Give new members their display-name sync role only."""
         if member.bot:
             return
-        await self._ensure_sync_role(member.guild, member)
+        # Buffer joins briefly so a burst (raid, bot added to a busy server) is handled concurrently, not one by one
+        guild = member.guild
+        self._join_buffer.setdefault(guild.id, []).append(member)
+        if guild.id not in self._join_flush_tasks:
+            self._join_flush_tasks[guild.id] = asyncio.create_task(self._flush_joins(guild.id))
+
+    async def _flush_joins(self, guild_id: int, delay: float = 0.5) -> None:
+        """After `delay`, give every buffered joiner of this guild their sync role, 8 at a time."""
+        await asyncio.sleep(delay)
+        self._join_flush_tasks.pop(guild_id, None)  # joins from here on schedule a new flush
+        members = self._join_buffer.pop(guild_id, [])
+        guild = self.bot.get_guild(guild_id)
+        if guild is None or not members:
+            return
+        existing_names = self._names_for(guild)  # shared so joiners with the same name don't both get a role
+        pending: dict[str, dict] = {}  # new sync-role fields per joiner, merged into Config in one write
+        try:
+            results = await _gather_bounded(
+                (self._ensure_sync_role(guild, m, existing_names, pending=pending) for m in members), limit=8
+            )
+        finally:
+            await self._patch_entries(guild, pending)
+        for member, result in zip(members, results):
+            if isinstance(result, Exception):
+                log.error("UserHandle: could not give joined member %s a sync role", member.id, exc_info=result)
+
+    async def _follow_display_name(self, member: discord.Member) -> None:
+        """Event path: rename this member's tracked sync role to their current display name. One role.edit at most."""
+        if member.bot:
+            return
+        guild = member.guild
+        if await self.config.guild(guild).chron_disabled():
+            return
+        info = (await self._get_assignments(guild)).get(str(member.id))
+        sync_role_id = info.get("sync_role_id") if info else None
+        if not sync_role_id:
+            return
+        role = guild.get_role(sync_role_id)
+        if role is None:
+            return  # the background pass cleans up deleted roles
+        desired_name = (_display_name(member) or member.name).strip() or member.name
+        if role.name == desired_name:
+            return
+        if desired_name in self._names_for(guild):
+            log.info("UserHandle: duplicate display name '%s' in guild %s, not renaming", desired_name, guild.id)
+            return
+        try:
+            await role.edit(name=desired_name, reason="UserHandle: sync display name")
+        except (discord.Forbidden, discord.HTTPException) as e:
+            log.warning("UserHandle: could not rename sync role %s in guild %s: %s", role.id, guild.id, e)
+            return
+        self._queue_log_dm(
+            guild,
+            f"**Success (rename)** — Display-name role followed a name change.\n"
+            f"• **User affected:** {member.display_name} (username: `{member.name}`, id: `{member.id}`)\n"
+            f"• **Changes applied:** sync role renamed to **{desired_name}**."
+        )
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        """Nickname changed: rename the member's sync role right away."""
+        if _display_name(before) != _display_name(after):
+            self._dirty_guilds.add(after.guild.id)
+            await self._follow_display_name(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User) -> None:
+        """Username / global name changed: rename the sync role in every guild where it's the display name."""
+        if before.name == after.name and before.display_name == after.display_name:
+            return
+        for guild in self.bot.guilds:
+            member = guild.get_member(after.id)
+            if member is not None:
+                self._dirty_guilds.add(guild.id)
+                await self._follow_display_name(member)
+
+    def _forget_role_name(self, role: discord.Role, name: str) -> None:
+        """Drop name from the cached name set unless another role still uses it."""
+        names = self._name_cache.get(role.guild.id)
+        if names is not None:
+            _release_name(names, role.guild, name, role.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        """Keep the cached role-name set current."""
+        names = self._name_cache.get(role.guild.id)
+        if names is not None:
+            names.add(role.name)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """Keep the cached role-name set current; a renamed sync role is put back by the next background pass."""
+        if before.name == after.name:
+            return
+        names = self._name_cache.get(after.guild.id)
+        if names is not None:
+            self._forget_role_name(after, before.name)
+            names.add(after.name)
+        entries = self._cache.get(after.guild.id) or {}
+        if any(info.get("sync_role_id") == after.id for info in entries.values()):
+            self._dirty_guilds.add(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """A tracked sync role was deleted: let the next background pass clean up and recreate state."""
+        self._forget_role_name(role, role.name)
+        entries = self._cache.get(role.guild.id) or {}
+        if any(info.get("sync_role_id") == role.id for info in entries.values()):
+            self._dirty_guilds.add(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """Drop the cached assignments for a guild the bot has left."""
+        self._cache.pop(guild.id, None)
+        self._handle_owners.pop(guild.id, None)
+        self._name_cache.pop(guild.id, None)
+        self._blacklist_cache.pop(guild.id, None)
+        self._dirty_guilds.discard(guild.id)